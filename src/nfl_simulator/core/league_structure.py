@@ -5,13 +5,13 @@ Creates complete NFL league structure with all teams, divisions, and conferences
 using the canonical data from constants.py
 """
 
-from typing import List, Dict, Tuple
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 from nfl_simulator.models.team import Team, Division, Conference
-from nfl_simulator.utils.constants import (
-    TEAM_NAMES,
-    AFC_EAST, AFC_NORTH, AFC_SOUTH, AFC_WEST,
-    NFC_EAST, NFC_NORTH, NFC_SOUTH, NFC_WEST
-)
+from nfl_simulator.utils.constants import TEAM_CITY_AND_NAME, DIVISION_MEMBERS
+
+# Read-only (team_by_id, teams_by_division, teams_by_conference) lookup tables
+LeagueIndex = Tuple[Mapping[str, Team], Mapping[str, Tuple[Team, ...]], Mapping[str, Tuple[Team, ...]]]
 
 
 def create_league_structure() -> Tuple[List[Conference], List[Division], List[Team]]:
@@ -52,37 +52,14 @@ def create_league_structure() -> Tuple[List[Conference], List[Division], List[Te
         "NFC_WEST": divisions[7],
     }
 
-    # Team assignments to divisions
-    division_assignments = {
-        "AFC_EAST": AFC_EAST,
-        "AFC_NORTH": AFC_NORTH,
-        "AFC_SOUTH": AFC_SOUTH,
-        "AFC_WEST": AFC_WEST,
-        "NFC_EAST": NFC_EAST,
-        "NFC_NORTH": NFC_NORTH,
-        "NFC_SOUTH": NFC_SOUTH,
-        "NFC_WEST": NFC_WEST,
-    }
-
     # Create all teams
     teams = []
-    for division_id, team_abbrevs in division_assignments.items():
+    for division_id, team_abbrevs in DIVISION_MEMBERS.items():
         division = division_map[division_id]
         for abbrev in team_abbrevs:
-            if abbrev in TEAM_NAMES:
-                full_name = TEAM_NAMES[abbrev]
-                # Split team name into city and team name
-                # Handle multi-word cities (Kansas City, New England, etc.)
-                parts = full_name.split()
-                if len(parts) >= 2:
-                    # Last word is always team name, everything else is city
-                    name = parts[-1]
-                    city = " ".join(parts[:-1])
-                else:
-                    # Single word team name (unusual case)
-                    city = full_name
-                    name = full_name
-
+            if abbrev in TEAM_CITY_AND_NAME:
+                # City and team name are pre-split in constants.py
+                city, name = TEAM_CITY_AND_NAME[abbrev]
                 team = Team(abbrev, name, city, division)
                 teams.append(team)
             else:
@@ -91,6 +68,36 @@ def create_league_structure() -> Tuple[List[Conference], List[Division], List[Te
     return conferences, divisions, teams
 
 
+def get_league_index(teams: List[Team]) -> LeagueIndex:
+    """
+    Build the lookup indexes for a list of teams in a single pass.
+
+    Build it once and hold on to it for repeated lookups (as ScheduleManager does
+    with its team index); the getters below scan the list and never build it.
+    The result reflects the list's contents at the time of the call.
+
+    Args:
+        teams: List of all teams
+
+    Returns:
+        Tuple of read-only (team_by_id, teams_by_division, teams_by_conference)
+        mappings; the grouped teams are tuples
+    """
+    team_by_id = {}
+    teams_by_division = {}
+    teams_by_conference = {}
+    for team in teams:
+        team_by_id.setdefault(team.team_id, team)
+        teams_by_division.setdefault(team.division.name, []).append(team)
+        teams_by_conference.setdefault(team.conference.name, []).append(team)
+
+    return (
+        MappingProxyType(team_by_id),
+        MappingProxyType({name: tuple(group) for name, group in teams_by_division.items()}),
+        MappingProxyType({name: tuple(group) for name, group in teams_by_conference.items()}),
+    )
+
+
 def get_team_by_abbreviation(teams: List[Team], abbrev: str) -> Team:
     """
     Find a team by its abbreviation.
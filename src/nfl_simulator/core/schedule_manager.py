@@ -8,16 +8,26 @@ Handles loading schedules from multiple sources:
 """
 
 import csv
+import io
 import json
 import logging
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Dict, IO, Iterable, List, Optional, Sequence, Union
 from pathlib import Path
 
+try:
+    # orjson is optional; it parses large schedule files several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from nfl_simulator.models.game import Game
 from nfl_simulator.models.season import Season
-from nfl_simulator.utils.constants import TEAM_NAMES
-from nfl_simulator.core.league_structure import get_team_by_abbreviation
+from nfl_simulator.utils.constants import TEAM_ABBR_SET, canonical_team
+
+# Accepted "<date> <time>" formats for schedule entries
+_DATE_FORMATS = ('%Y-%m-%d %H:%M', '%m/%d/%Y %H:%M', '%Y-%m-%d %H:%M:%S')
 
 
 class ScheduleLoadError(Exception):
@@ -31,6 +41,8 @@ class ScheduleManager:
     def __init__(self, season: Season):
         """Initialize with a Season object to populate with games"""
         self.season = season
+        self._team_index = {team.team_id: team for team in season.teams}
+        self._last_date_format: Optional[str] = None  # Format that parsed the previous game
         self.logger = logging.getLogger(__name__)
 
     def load_schedule(self, mode: str, **kwargs) -> None:
@@ -55,17 +67,21 @@ class ScheduleManager:
         else:
             raise ScheduleLoadError(f"Unknown mode: {mode}")
 
-    def load_manual_schedule(self, source: Union[str, Path, dict]) -> None:
+    def load_manual_schedule(self, source: Union[str, Path, dict, bytes, IO, Sequence[Sequence[str]]]) -> None:
         """
-        Load schedule from manual input (CSV file, JSON file, or dict)
+        Load schedule from manual input (CSV file, JSON file, dict, JSON bytes, CSV stream or CSV rows)
 
         Args:
-            source: File path (str/Path) or dictionary data
+            source: File path (str/Path), dictionary data, raw JSON document bytes,
+                a file-like object with CSV content, or pre-parsed CSV rows (header row first)
         """
         try:
             if isinstance(source, dict):
                 # Direct dictionary input
                 self._load_from_dict(source)
+            elif isinstance(source, (bytes, bytearray)):
+                # Raw JSON document, e.g. an API response body
+                self._load_from_dict(_json_loads(source))
             elif isinstance(source, (str, Path)):
                 source_path = Path(source)
                 if source_path.suffix.lower() == '.csv':
@@ -74,10 +90,19 @@ class ScheduleManager:
                     self._load_from_json(source_path)
                 else:
                     raise ScheduleLoadError(f"Unsupported file format: {source_path.suffix}")
+            elif isinstance(source, Sequence):
+                # Pre-parsed CSV rows (list, tuple, ...); str paths were handled above
+                self._load_from_rows(source)
+            elif hasattr(source, 'read'):
+                # In-memory or already-open CSV stream
+                data = source.read()
+                if isinstance(data, bytes):
+                    data = data.decode('utf-8')
+                self._load_from_rows(csv.reader(io.StringIO(data, newline='')))
             else:
                 raise ScheduleLoadError(f"Invalid source type: {type(source)}")
 
-            self.logger.info(f"Successfully loaded {len(self.season.games)} games")
+            self.logger.info("Successfully loaded %d games", len(self.season.games))
 
         except Exception as e:
             raise ScheduleLoadError(f"Error loading manual schedule: {str(e)}")
@@ -87,35 +112,59 @@ class ScheduleManager:
         if not file_path.exists():
             raise ScheduleLoadError(f"File not found: {file_path}")
 
-        games_loaded = 0
-        with open(file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-
-            # Validate required columns
-            required_columns = {'week', 'home_team', 'away_team'}
-            if not required_columns.issubset(reader.fieldnames):
-                missing = required_columns - set(reader.fieldnames)
-                raise ScheduleLoadError(f"Missing required columns: {missing}")
-
-            for row_num, row in enumerate(reader, 2):  # Start at 2 for header
-                try:
-                    game = self._create_game_from_data(row)
-                    self.season.games.append(game)
-                    games_loaded += 1
-                except Exception as e:
-                    self.logger.warning(f"Skipping row {row_num}: {str(e)}")
-
-        if games_loaded == 0:
+        # Schedule files are small, so read the whole file in one call and parse from memory
+        with open(file_path, 'rb') as csvfile:
+            data = csvfile.read().decode('utf-8')
+
+        self._load_from_rows(csv.reader(io.StringIO(data, newline='')))
+
+    def _load_from_rows(self, reader: Iterable[Sequence[str]]) -> None:
+        """Load schedule from CSV rows, the first of which is the header"""
+        reader = iter(reader)
+        header = next(reader, [])
+
+        # Validate required columns
+        required_columns = {'week', 'home_team', 'away_team'}
+        if not required_columns.issubset(header):
+            missing = required_columns - set(header)
+            raise ScheduleLoadError(f"Missing required columns: {missing}")
+
+        # Resolve column positions once instead of building a dict per row
+        idx = {name: i for i, name in enumerate(header)}
+        week_i, home_i, away_i = idx['week'], idx['home_team'], idx['away_team']
+        date_i = idx.get('date')
+        time_i = idx.get('time')
+
+        batch: List[Game] = []
+        append = batch.append
+        for row_num, row in enumerate(reader, 2):  # Start at 2 for header
+            if not row:
+                continue
+            try:
+                row_len = len(row)
+                game = self._create_game_from_fields(
+                    row[week_i],
+                    row[home_i],
+                    row[away_i],
+                    row[date_i] if date_i is not None and date_i < row_len else None,
+                    row[time_i] if time_i is not None and time_i < row_len else None,
+                )
+                append(game)
+            except Exception as e:
+                self.logger.warning("Skipping row %d: %s", row_num, e)
+
+        if not batch:
             raise ScheduleLoadError("No valid games loaded from CSV")
 
+        self._add_games(batch)
+
     def _load_from_json(self, file_path: Path) -> None:
         """Load schedule from JSON file"""
         if not file_path.exists():
             raise ScheduleLoadError(f"File not found: {file_path}")
 
-        with open(file_path, 'r', encoding='utf-8') as jsonfile:
-            data = json.load(jsonfile)
-            self._load_from_dict(data)
+        # Parse straight from bytes; orjson (when installed) skips the text decode step
+        self._load_from_dict(_json_loads(file_path.read_bytes()))
 
     def _load_from_dict(self, data: dict) -> None:
         """Load schedule from dictionary data"""
@@ -126,25 +175,25 @@ class ScheduleManager:
         if not isinstance(games_data, list):
             raise ScheduleLoadError("'games' must be a list")
 
-        print(f"Loading {len(games_data)} games from dictionary")
-
-        games_loaded = 0
+        batch: List[Game] = []
+        append = batch.append
         for i, game_data in enumerate(games_data):
-            print(f"Processing game {i}: {game_data}")
             try:
-                game = self._create_game_from_data(game_data)
-                self.season.games.append(game)  # Direct append instead of add_game()
-                games_loaded += 1
-                print(f"Successfully loaded game {i}")
+                append(self._create_game_from_data(game_data))
             except Exception as e:
-                print(f"Failed to load game {i}: {e}")
-                import traceback
-                traceback.print_exc()
-                self.logger.warning(f"Skipping game {i}: {str(e)}")
+                self.logger.warning("Skipping game %d: %s", i, e)
 
-        if games_loaded == 0:
+        self.logger.debug("Loaded %d of %d games from dictionary", len(batch), len(games_data))
+
+        if not batch:
             raise ScheduleLoadError("No valid games loaded from data")
 
+        self._add_games(batch)
+
+    def _add_games(self, games: List[Game]) -> None:
+        """Add a batch of parsed games to the season in one step"""
+        self.season.games.extend(games)  # Direct extend instead of add_game()
+
     def _create_game_from_data(self, game_data: dict) -> Game:
         """
         Create a Game object from raw data dictionary
@@ -155,58 +204,70 @@ class ScheduleManager:
         Returns:
             Game object
         """
-        # Validate required fields
-        required_fields = {'week', 'home_team', 'away_team'}
-        missing_fields = required_fields - set(game_data.keys())
-        if missing_fields:
+        # Validate required fields with one lookup each
+        week = game_data.get('week')
+        home = game_data.get('home_team')
+        away = game_data.get('away_team')
+        if week is None or home is None or away is None:
+            missing_fields = {name for name in ('week', 'home_team', 'away_team') if game_data.get(name) is None}
             raise ValueError(f"Missing required fields: {missing_fields}")
 
-        # Validate week number
-        try:
-            week = int(game_data['week'])
-            if week < 1 or week > 22:  # Regular season (1-18) + playoffs (19-22)
-                raise ValueError(f"Week must be between 1-22, got: {week}")
-        except (ValueError, TypeError):
-            raise ValueError(f"Invalid week number: {game_data['week']}")
+        return self._create_game_from_fields(week, home, away, game_data.get('date'), game_data.get('time'))
 
-        # Validate and get team objects
-        home_abbr = str(game_data['home_team']).upper()
-        away_abbr = str(game_data['away_team']).upper()
-
-        if home_abbr not in TEAM_NAMES:
-            raise ValueError(f"Unknown home team abbreviation: {home_abbr}")
-        if away_abbr not in TEAM_NAMES:
-            raise ValueError(f"Unknown away team abbreviation: {away_abbr}")
-        if home_abbr == away_abbr:
-            raise ValueError("Home and away team cannot be the same")
+    def _create_game_from_fields(self, week, home, away, date=None, time=None) -> Game:
+        """
+        Create a Game object from individual raw field values
 
-        home_team = get_team_by_abbreviation(self.season.teams,home_abbr)
-        away_team = get_team_by_abbreviation(self.season.teams, away_abbr)
+        Args:
+            week: Week number (int or numeric string)
+            home: Home team abbreviation
+            away: Away team abbreviation
+            date: Optional game date string
+            time: Optional kickoff time string (defaults to 13:00)
 
-        if not home_team or not away_team:
+        Returns:
+            Game object
+        """
+        # Validate week number
+        try:
+            week_num = int(week)
+        except (ValueError, TypeError):
+            week_num = 0
+        if not 1 <= week_num <= 22:  # Regular season (1-18) + playoffs (19-22)
+            raise ValueError(f"Invalid week number: {week}")
+        week = week_num
+
+        # Get team objects, working out which check failed only when a lookup misses
+        home_abbr = canonical_team(str(home))
+        away_abbr = canonical_team(str(away))
+        home_team = self._team_index.get(home_abbr)
+        away_team = self._team_index.get(away_abbr)
+
+        if home_team is None or away_team is None or home_abbr == away_abbr:
+            if home_abbr not in TEAM_ABBR_SET:
+                raise ValueError(f"Unknown home team abbreviation: {home_abbr}")
+            if away_abbr not in TEAM_ABBR_SET:
+                raise ValueError(f"Unknown away team abbreviation: {away_abbr}")
+            if home_abbr == away_abbr:
+                raise ValueError("Home and away team cannot be the same")
             raise ValueError("Could not find team objects")
 
         # Parse date/time if provided (store separately since Game class doesn't have datetime)
         game_datetime = None
-        if 'date' in game_data and game_data['date']:
+        if date:
             try:
-                date_str = str(game_data['date'])
-                time_str = str(game_data.get('time', '13:00'))  # Default to 1 PM
+                date_str = str(date)
+                time_str = str(time) if time is not None else '13:00'  # Default to 1 PM
 
                 # Handle various date formats
                 datetime_str = f"{date_str} {time_str}"
-                for fmt in ['%Y-%m-%d %H:%M', '%m/%d/%Y %H:%M', '%Y-%m-%d %H:%M:%S']:
-                    try:
-                        game_datetime = datetime.strptime(datetime_str, fmt)
-                        break
-                    except ValueError:
-                        continue
+                game_datetime = self._parse_datetime(datetime_str)
 
                 if not game_datetime:
-                    self.logger.warning(f"Could not parse datetime: {datetime_str}")
+                    self.logger.warning("Could not parse datetime: %s", datetime_str)
 
             except Exception as e:
-                self.logger.warning(f"Error parsing game datetime: {e}")
+                self.logger.warning("Error parsing game datetime: %s", e)
 
         # Generate a unique game ID
         game_id = f"{away_abbr}@{home_abbr}_W{week}"
@@ -225,6 +286,39 @@ class ScheduleManager:
 
         return game
 
+    def _parse_datetime(self, datetime_str: str) -> Optional[datetime]:
+        """
+        Parse a "<date> <time>" string using the supported formats
+
+        The format that matched the previous game is tried first, since a
+        schedule file almost always uses a single format throughout.
+
+        Args:
+            datetime_str: Combined date and time string
+
+        Returns:
+            Parsed datetime, or None if no format matches
+        """
+        strptime = datetime.strptime
+        last_fmt = self._last_date_format
+        if last_fmt is not None:
+            try:
+                return strptime(datetime_str, last_fmt)
+            except ValueError:
+                pass
+
+        for fmt in _DATE_FORMATS:
+            if fmt == last_fmt:
+                continue
+            try:
+                game_datetime = strptime(datetime_str, fmt)
+            except ValueError:
+                continue
+            self._last_date_format = fmt
+            return game_datetime
+
+        return None
+
     def load_from_api(self, api_source: str = "espn") -> None:
         """
         Load current season schedule from API source
@@ -254,39 +348,45 @@ class ScheduleManager:
         """
         issues = []
 
+        # Count regular season games per team and spot duplicates in one pass over the
+        # current games, so games added or replaced outside the loaders are always seen
+        regular_season_games = 0
+        team_game_counts: Counter = Counter()
+        game_signatures = set()
+        duplicate_issues = []
+        for game in self.season.games:
+            home_id, away_id = game.home_team.team_id, game.away_team.team_id
+
+            if game.week <= 18:
+                regular_season_games += 1
+                team_game_counts[home_id] += 1
+                team_game_counts[away_id] += 1
+
+            # Create signature regardless of home/away order
+            teams = (home_id, away_id) if home_id < away_id else (away_id, home_id)
+            signature = (game.week, teams)
+            if signature in game_signatures:
+                duplicate_issues.append(f"Duplicate game found: {teams} in week {game.week}")
+            game_signatures.add(signature)
+
         # Check total games (should be 272 for regular season: 17 games * 32 teams / 2)
-        regular_season_games = [g for g in self.season.games if g.week <= 18]
         expected_games = 17 * 32 // 2  # 272 games
 
-        if len(regular_season_games) != expected_games:
-            issues.append(f"Expected {expected_games} regular season games, found {len(regular_season_games)}")
+        if regular_season_games != expected_games:
+            issues.append(f"Expected {expected_games} regular season games, found {regular_season_games}")
 
         # Check each team has 17 regular season games
-        team_game_counts = {}
-        for game in regular_season_games:
-            for team in [game.home_team, game.away_team]:
-                team_abbr = team.team_id
-                team_game_counts[team_abbr] = team_game_counts.get(team_abbr, 0) + 1
-
         for team_abbr, count in team_game_counts.items():
             if count != 17:
                 issues.append(f"Team {team_abbr} has {count} games, should have 17")
 
-        # Check for duplicate games
-        game_signatures = set()
-        for game in self.season.games:
-            # Create signature regardless of home/away order
-            teams = tuple(sorted([game.home_team.team_id, game.away_team.team_id]))
-            signature = (game.week, teams)
-            if signature in game_signatures:
-                issues.append(f"Duplicate game found: {teams} in week {game.week}")
-            game_signatures.add(signature)
+        issues.extend(duplicate_issues)
 
         return {
             'valid': len(issues) == 0,
             'issues': issues,
             'total_games': len(self.season.games),
-            'regular_season_games': len(regular_season_games)
+            'regular_season_games': regular_season_games
         }
 
 
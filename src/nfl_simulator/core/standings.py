@@ -4,6 +4,7 @@ NFL Standings Calculator
 Calculates team standings, records, and playoff picture from game results
 """
 
+import heapq
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 from nfl_simulator.models.team import Team
@@ -84,27 +85,29 @@ def calculate_team_records(games: List[Game], teams: List[Team]) -> Dict[str, Te
         Dictionary mapping team_id to TeamRecord
     """
     # Initialize records for all teams
-    records = {}
-    for team in teams:
-        records[team.team_id] = TeamRecord(team)
+    records = {team.team_id: TeamRecord(team) for team in teams}
 
-    # Process all played games
+    # Process all played games in a single pass
     for game in games:
-        if game.is_played():
-            home_score, away_score = game.score
-
-            if home_score > away_score:
-                # Home team wins
-                records[game.home_team.team_id].wins += 1
-                records[game.away_team.team_id].losses += 1
-            elif away_score > home_score:
-                # Away team wins
-                records[game.away_team.team_id].wins += 1
-                records[game.home_team.team_id].losses += 1
-            else:
-                # Tie game
-                records[game.home_team.team_id].ties += 1
-                records[game.away_team.team_id].ties += 1
+        home_score = game.home_score
+        if home_score is None:
+            continue  # Not played yet
+        away_score = game.away_score
+
+        home_record = records[game.home_team.team_id]
+        away_record = records[game.away_team.team_id]
+        if home_score > away_score:
+            # Home team wins
+            home_record.wins += 1
+            away_record.losses += 1
+        elif away_score > home_score:
+            # Away team wins
+            away_record.wins += 1
+            home_record.losses += 1
+        else:
+            # Tie game
+            home_record.ties += 1
+            away_record.ties += 1
 
     return records
 
@@ -160,6 +163,12 @@ def calculate_conference_standings(teams: List[Team], team_records: Dict[str, Te
         # Get teams in this conference
         conf_teams = [team for team in teams if team.conference.name == conf_name]
 
+        # Compute each team's win percentage once and reuse it for every ranking below
+        win_pct = {team.team_id: team_records[team.team_id].win_percentage for team in conf_teams}
+
+        def by_win_pct(record: TeamRecord) -> float:
+            return win_pct[record.team.team_id]
+
         # Calculate division standings for this conference
         div_standings = []
         division_winners = []
@@ -175,31 +184,27 @@ def calculate_conference_standings(teams: List[Team], team_records: Dict[str, Te
         # Process each division
         for div_name, div_teams in divisions.items():
             div_records = [team_records[team.team_id] for team in div_teams]
-            div_records.sort(key=lambda x: x.win_percentage, reverse=True)
+            div_records.sort(key=by_win_pct, reverse=True)
 
             div_standings.append(DivisionStandings(div_name, div_records))
             division_winners.append(div_records[0])  # First place team
 
         # Calculate wild card teams (non-division winners)
+        winner_ids = {winner.team.team_id for winner in division_winners}
         non_winners = []
         for team in conf_teams:
-            team_record = team_records[team.team_id]
-            # Check if this team is a division winner
-            is_winner = any(winner.team.team_id == team.team_id for winner in division_winners)
-            if not is_winner:
-                non_winners.append(team_record)
+            if team.team_id not in winner_ids:
+                non_winners.append(team_records[team.team_id])
 
-        # Sort non-winners by win percentage for wild card race
-        non_winners.sort(key=lambda x: x.win_percentage, reverse=True)
-        wild_card_teams = non_winners[:3]  # Top 3 non-division winners
+        # Top 3 non-division winners by win percentage for wild card race
+        wild_card_teams = heapq.nlargest(3, non_winners, key=by_win_pct)
 
         # Create playoff teams list (4 division winners + 3 wild cards)
         # TODO: This needs proper seeding rules
-        playoff_teams = division_winners + wild_card_teams
-        playoff_teams.sort(key=lambda x: x.win_percentage, reverse=True)
+        playoff_teams = heapq.nlargest(7, division_winners + wild_card_teams, key=by_win_pct)
 
         conference_standings.append(ConferenceStandings(
-            conf_name, div_standings, wild_card_teams, playoff_teams[:7]
+            conf_name, div_standings, wild_card_teams, playoff_teams
         ))
 
     return conference_standings
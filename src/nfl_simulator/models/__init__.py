@@ -7,13 +7,13 @@ Core data models for teams, games, players, seasons, and predictions
 from .team import Team, Division, Conference
 from .game import Game
 from .player import Player
-from .season import Season
+from .season import Season, GameTable
 from .predictions import GamePrediction, PlayerStatPrediction, SeasonPrediction
 
 __all__ = [
     'Team', 'Division', 'Conference',
     'Game',
     'Player',
-    'Season',
+    'Season', 'GameTable',
     'GamePrediction', 'PlayerStatPrediction', 'SeasonPrediction'
 ]
\ No newline at end of file
@@ -10,22 +10,34 @@ from nfl_simulator.models.team import Team, Division, Conference
 
 class Game:
     """Represents an NFL Game object"""
+    __slots__ = ('game_id', 'home_team', 'away_team', 'week', 'home_score', 'away_score', 'outcome', 'game_datetime')
+
     def __init__(self, game_id: str, home_team, away_team, week: int):
         self.game_id = game_id
         self.home_team = home_team
         self.away_team = away_team
         self.week = week
-        self.score = None
+        self.home_score = None
+        self.away_score = None
         self.outcome = None
+        self.game_datetime = None  # Set by ScheduleManager when the schedule provides one
 
     def set_result(self, home_score: int, away_score: int):
         """Set the the game result after it's been simulated"""
-        self.score = (home_score, away_score)
+        self.home_score = home_score
+        self.away_score = away_score
         self.outcome = self.home_team if home_score > away_score else self.away_team
 
     def is_played(self) -> bool:
         """Check if the game is played"""
-        return self.score is not None
+        return self.home_score is not None
+
+    @property
+    def score(self):
+        """The (home_score, away_score) tuple, or None if the game hasn't been played"""
+        if self.home_score is None:
+            return None
+        return (self.home_score, self.away_score)
 
     def __str__(self) -> str:
         """Display the game"""
@@ -37,6 +49,9 @@ class Game:
     def __eq__(self, other):
         return isinstance(other, Game) and self.game_id == other.game_id
 
+    def __hash__(self):
+        return hash(self.game_id)
+
 
 
 # uncomment to test
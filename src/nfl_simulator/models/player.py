@@ -7,6 +7,8 @@ Contains Player class and it's related attributes to represent NFL player data
 from nfl_simulator.models.team import Team
 
 class Player:
+    __slots__ = ('player_id', 'player_name', 'position', 'team')
+
     def __init__(self, player_id: int, player_name: str, position: str, team: Team):
         self.player_id = player_id
         self.player_name = player_name
@@ -20,4 +22,7 @@ class Player:
         return f"Player(id={self.player_id}, name='{self.player_name}', pos='{self.position}', team='{self.team.name}')"
 
     def __eq__(self, other):
-        return isinstance(other, Player) and self.player_id == other.player_id
\ No newline at end of file
+        return isinstance(other, Player) and self.player_id == other.player_id
+
+    def __hash__(self):
+        return hash(self.player_id)
\ No newline at end of file
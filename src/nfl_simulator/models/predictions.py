@@ -27,6 +27,9 @@ class GamePrediction:
     def __eq__(self, other):
         return isinstance(other, GamePrediction) and self.game == other.game
 
+    def __hash__(self):
+        return hash(self.game)
+
 class PlayerStatPrediction:
     """Represents player game stat prediction results and outcomes"""
     def __init__(self, player: Player, game: Game, predicted_stats: dict):
@@ -43,6 +46,9 @@ class PlayerStatPrediction:
     def __eq__(self, other):
         return isinstance(other, PlayerStatPrediction) and self.player == other.player and self.game == other.game
 
+    def __hash__(self):
+        return hash((self.player, self.game))
+
 class SeasonPrediction:
     """Represents season prediction results and outcomes"""
     def __init__(self, season: Season, playoff_teams: List[Team], super_bowl_winner: Team):
@@ -59,3 +65,6 @@ class SeasonPrediction:
     def __eq__(self, other):
         return isinstance(other, SeasonPrediction) and self.season == other.season
 
+    def __hash__(self):
+        return hash(self.season)
+
@@ -4,11 +4,67 @@ NFL Season data models
 Represents NFL Season data and structure
 """
 
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import numpy as np
 from nfl_simulator.models.team import Team
 from nfl_simulator.models.game import Game
 
+
+def game_team_positions(games: List[Game], teams: List[Team]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Map each game's home and away team to its position in teams.
+
+    Returns:
+        Tuple of (home_idx, away_idx) integer arrays, one entry per game
+    """
+    team_pos = {team.team_id: i for i, team in enumerate(teams)}
+    home_idx = np.fromiter((team_pos[game.home_team.team_id] for game in games), dtype=np.intp, count=len(games))
+    away_idx = np.fromiter((team_pos[game.away_team.team_id] for game in games), dtype=np.intp, count=len(games))
+    return home_idx, away_idx
+
+
+def game_scores(games: List[Game]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Collect the current scores of games as arrays.
+
+    Returns:
+        Tuple of (home_scores, away_scores, played); unplayed games score 0-0
+        and have played set to False
+    """
+    home_scores = np.fromiter((game.home_score or 0 for game in games), dtype=np.float64, count=len(games))
+    away_scores = np.fromiter((game.away_score or 0 for game in games), dtype=np.float64, count=len(games))
+    played = np.fromiter((game.home_score is not None for game in games), dtype=bool, count=len(games))
+    return home_scores, away_scores, played
+
+
+@dataclass(frozen=True, eq=False)
+class GameTable:
+    """
+    A list of games as parallel NumPy arrays, one entry per game.
+
+    home_idx/away_idx hold each team's position in the teams list the table was
+    built from; unplayed games score 0-0 and have played set to False. Tables
+    compare and hash by identity, since array fields have no single truth value.
+    """
+    home_idx: np.ndarray
+    away_idx: np.ndarray
+    home_scores: np.ndarray
+    away_scores: np.ndarray
+    played: np.ndarray
+
+    @classmethod
+    def from_games(cls, games: List[Game], teams: List[Team]) -> 'GameTable':
+        """Build a table for games, indexing teams by their position in teams"""
+        return cls(*game_team_positions(games, teams), *game_scores(games))
+
+    def __len__(self):
+        return len(self.played)
+
+
 class Season:
+    __slots__ = ('year', 'current_week', 'games', 'teams', 'is_playoffs_started', 'super_bowl_winner')
+
     def __init__(self, year: int, current_week: int, games: List[Game], teams: List[Team], is_playoffs_started: bool, super_bowl_winner: Optional[Team]= None):
         self.year = year
         self.current_week = current_week
@@ -17,6 +73,18 @@ class Season:
         self.is_playoffs_started = is_playoffs_started
         self.super_bowl_winner = super_bowl_winner
 
+    def as_arrays(self) -> GameTable:
+        """
+        Return the season's games as a GameTable of parallel NumPy arrays.
+
+        The table is rebuilt from self.games on every call, so games added,
+        replaced or given results since the last call are always included.
+
+        Returns:
+            GameTable whose home_idx/away_idx hold each team's position in self.teams
+        """
+        return GameTable.from_games(self.games, self.teams)
+
     def __str__(self):
         return f"{self.year} NFL Season - Week {self.current_week}"
 
@@ -24,4 +92,7 @@ class Season:
         return f"Season(year={self.year}, week={self.current_week}, games={len(self.games)}, teams={len(self.teams)}, playoffs={self.is_playoffs_started})"
 
     def __eq__(self, other):
-        return isinstance(other, Season) and self.year == other.year
\ No newline at end of file
+        return isinstance(other, Season) and self.year == other.year
+
+    def __hash__(self):
+        return hash(self.year)
\ No newline at end of file
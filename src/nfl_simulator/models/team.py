@@ -5,28 +5,37 @@ Contains Team, Division and Conference classes that represent the structure
 of NFL teams and their organizational hierarchy.
 """
 
+import sys
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
 class Team:
     """
     Represents a NFL team with basic identifying information and relationships.
-    """
-    def __init__(self, team_id: str, name: str, city: str, division) -> None:
-        """
-        Initializes a new Team object.
 
-        Args:
-            team_id (str): The ID of the team.
-            name (str): The name of the team.
-            city (str): The city of the team.
-            division (str): The division of the team.
+    Teams are immutable once created, so they are safe to use as dict keys and to
+    share between seasons.
 
-        Note:
-            conference is automatically derived from the division parameter.
-        """
-        self.team_id = team_id
-        self.name = name
-        self.city = city
-        self.division = division
-        self.conference = division.conference
+    Args:
+        team_id (str): The ID of the team.
+        name (str): The name of the team.
+        city (str): The city of the team.
+        division (Division): The division of the team.
+
+    Note:
+        conference is automatically derived from the division parameter.
+    """
+    team_id: str
+    name: str
+    city: str
+    division: 'Division'
+    conference: 'Conference' = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Identifiers are interned so equality checks and dict lookups on them hit the identity fast path
+        object.__setattr__(self, 'team_id', sys.intern(self.team_id))
+        object.__setattr__(self, 'conference', self.division.conference)
 
     def __str__(self) -> str:
         """ Return the team's full name."""
@@ -52,23 +61,28 @@ class Team:
             return False
         return self.team_id == other.team_id
 
+    def __hash__(self) -> int:
+        """Hash on team_id, consistent with __eq__."""
+        return hash(self.team_id)
 
+
+@dataclass(frozen=True, slots=True)
 class Division:
     """
     Represents a NFL Division with identifying information and relationships.
+
+    Args:
+       division_id (str): Division identifier
+       name (str): Full division name (e.g., 'NFC West')
+       conference: Conference object this division belongs to
     """
-    def __init__(self, division_id: str, name: str, conference) -> None:
-        """
-        Initializes a new Division object.
+    division_id: str
+    name: str
+    conference: 'Conference'
 
-        Args:
-           division_id (str): Division identifier
-           name (str): Full division name (e.g., 'NFC West')
-           conference: Conference object this division belongs to
-        """
-        self.division_id = division_id
-        self.name = name
-        self.conference = conference
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'division_id', sys.intern(self.division_id))
+        object.__setattr__(self, 'name', sys.intern(self.name))
 
     def __str__(self) -> str:
         """Return the division's full name for display purposes."""
@@ -92,15 +106,22 @@ class Division:
             return False
         return self.division_id == other.division_id
 
+    def __hash__(self) -> int:
+        """Hash on division_id, consistent with __eq__."""
+        return hash(self.division_id)
+
+@dataclass(frozen=True, slots=True)
 class Conference:
-    """Represents a NFL Conference with identifying information and relationships."""
-    def __init__(self, name: str) -> None:
-        """
-        Initializes a new Conference object.
-        Args:
-            name (str): Conference name (AFC or NFC)
-        """
-        self.name = name
+    """
+    Represents a NFL Conference with identifying information and relationships.
+
+    Args:
+        name (str): Conference name (AFC or NFC)
+    """
+    name: str
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'name', sys.intern(self.name))
 
     def __str__(self) -> str:
         """Return the conference name for display purposes."""
@@ -124,6 +145,10 @@ class Conference:
             return False
         return self.name == other.name
 
+    def __hash__(self) -> int:
+        """Hash on name, consistent with __eq__."""
+        return hash(self.name)
+
 
 #uncomment to test
 #test_conf = Conference("NFL Test")
@@ -5,9 +5,15 @@ Contains canonical team data, aliases, historical names, and league structure
 constants used throughout the NFL season simulator
 """
 
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
 
-#map team abbreviations to full team names (canonical source)
-TEAM_NAMES = {
+
+#map team abbreviations to full team names (canonical source, read-only)
+TEAM_NAMES = MappingProxyType({
     'ARI': 'Arizona Cardinals',
     'ATL': 'Atlanta Falcons',
     'BAL': 'Baltimore Ravens',
@@ -40,10 +46,31 @@ TEAM_NAMES = {
     'TB': 'Tampa Bay Buccaneers',
     'TEN': 'Tennessee Titans',
     'WAS': 'Washington Commanders',
-}
+})
+
+#canonical team abbreviations, for membership checks
+TEAM_ABBR_SET = frozenset(TEAM_NAMES)
+
+#fixed team ordinals (0..31), so hot loops and arrays can index teams by int
+TEAM_ORDER = tuple(TEAM_NAMES)
+TEAM_IDX = MappingProxyType({team: i for i, team in enumerate(TEAM_ORDER)})
+TEAM_NAME_BY_IDX = tuple(TEAM_NAMES[team] for team in TEAM_ORDER)
+
+
+#split a full team name into (city, name); the last word is always the team name
+def _split_team_name(full_name):
+    city, _, name = full_name.rpartition(' ')
+    if not city:
+        # Single word team name (unusual case)
+        city = name
+    return city, name
 
-#TEAM ALIASES: variations in use
-TEAM_ALIASES = {
+
+#map team abbreviations to (city, name), split once at import
+TEAM_CITY_AND_NAME = MappingProxyType({abbrev: _split_team_name(full_name) for abbrev, full_name in TEAM_NAMES.items()})
+
+#TEAM ALIASES: variations in use (read-only)
+TEAM_ALIASES = MappingProxyType({
     'ARI': 'ARI',
     'ARIZ': 'ARI',
     'ARIZONA': 'ARI',
@@ -52,7 +79,15 @@ TEAM_ALIASES = {
     'NE': 'NE',
     'NEP': 'NE',
     'PATS': 'NE',
-}
+})
+
+#upper-cased aliases, so normalizing a team cell is a single lookup
+ALIAS_TABLE = MappingProxyType({sys.intern(k.upper()): sys.intern(v) for k, v in TEAM_ALIASES.items()})
+
+
+def canonical_team(name):
+    key = name.strip().upper()
+    return ALIAS_TABLE.get(key, key)
 
 #handles historical name changes
 HISTORICAL_NAMES = {
@@ -80,32 +115,67 @@ TIEBREAKER_CRITERIA = [
 ]
 
 
-#league conference structure
-AFC_TEAMS = ['BUF', 'MIA', 'NYJ', 'NE', 'BAL', 'PIT', 'CLE', 'CIN', 'HOU', 'JAX', 'IND', 'TEN', 'KC', 'DEN', 'LAC', 'LV']
-NFC_TEAMS = ['DAL', 'NYG', 'PHI', 'WAS','MIN', 'GB', 'DET', 'CHI', 'CAR', 'TB', 'ATL', 'NO', 'SEA', 'SF', 'LAR', 'ARI']
-
 #league division structure
-AFC_EAST = ['BUF', 'MIA', 'NYJ', 'NE']
-AFC_NORTH = ['BAL', 'PIT', 'CLE', 'CIN']
-AFC_SOUTH = ['HOU', 'JAX', 'IND', 'TEN']
-AFC_WEST = ['KC', 'DEN', 'LAC', 'LV']
-NFC_EAST = ['DAL', 'NYG', 'PHI', 'WAS']
-NFC_NORTH = ['MIN', 'GB', 'DET', 'CHI']
-NFC_SOUTH = ['CAR', 'TB', 'ATL', 'NO']
-NFC_WEST = ['SEA', 'SF', 'LAR', 'ARI']
+AFC_EAST = ('BUF', 'MIA', 'NYJ', 'NE')
+AFC_NORTH = ('BAL', 'PIT', 'CLE', 'CIN')
+AFC_SOUTH = ('HOU', 'JAX', 'IND', 'TEN')
+AFC_WEST = ('KC', 'DEN', 'LAC', 'LV')
+NFC_EAST = ('DAL', 'NYG', 'PHI', 'WAS')
+NFC_NORTH = ('MIN', 'GB', 'DET', 'CHI')
+NFC_SOUTH = ('CAR', 'TB', 'ATL', 'NO')
+NFC_WEST = ('SEA', 'SF', 'LAR', 'ARI')
+
+#division id -> member abbreviations, in league order
+DIVISION_MEMBERS = MappingProxyType({
+    'AFC_EAST': AFC_EAST,
+    'AFC_NORTH': AFC_NORTH,
+    'AFC_SOUTH': AFC_SOUTH,
+    'AFC_WEST': AFC_WEST,
+    'NFC_EAST': NFC_EAST,
+    'NFC_NORTH': NFC_NORTH,
+    'NFC_SOUTH': NFC_SOUTH,
+    'NFC_WEST': NFC_WEST,
+})
+
+#team abbreviation -> division id
+TEAM_TO_DIVISION = MappingProxyType({team: division for division, members in DIVISION_MEMBERS.items() for team in members})
+
+
+def division_of(team):
+    return TEAM_TO_DIVISION[team]
+
+
+#league conference structure, derived from the divisions
+AFC_TEAMS = frozenset(chain(AFC_EAST, AFC_NORTH, AFC_SOUTH, AFC_WEST))
+NFC_TEAMS = frozenset(chain(NFC_EAST, NFC_NORTH, NFC_SOUTH, NFC_WEST))
+
+
+#group HISTORICAL_NAMES into per-team (start, end, name) intervals sorted by start year
+def _build_historical_intervals():
+    intervals = {}
+    for (team, (start, end)), name in HISTORICAL_NAMES.items():
+        intervals.setdefault(team, []).append((start, end, name))
+    for team_intervals in intervals.values():
+        team_intervals.sort(key=lambda interval: interval[0])
+    return intervals
+
+
+_HISTORICAL_BY_TEAM = _build_historical_intervals()
+#parallel start-year lists so bisect can search them directly
+_HISTORICAL_STARTS = {team: [start for start, _, _ in intervals] for team, intervals in _HISTORICAL_BY_TEAM.items()}
 
 
 #function to align historical teams to canonical source
+#names are fixed at import, so results can be memoized (32 teams x ~100 seasons fits)
+@lru_cache(maxsize=4096)
 def get_historical_name(team, year):
-    for key, name in HISTORICAL_NAMES.items():
-        if key[0] == team:
-            start, end = key[1]
-            if end is None:  # current/ongoing
-                if year >= start:
-                    return name
-            else:  # specific range
-                if start <= year <= end:
-                    return name
-    else:
-        return TEAM_NAMES.get(team, f"Unknown team: {team}")
+    intervals = _HISTORICAL_BY_TEAM.get(team)
+    if intervals:
+        # Last interval starting at or before this year
+        idx = bisect_right(_HISTORICAL_STARTS[team], year) - 1
+        if idx >= 0:
+            start, end, name = intervals[idx]
+            if end is None or year <= end:  # None means current/ongoing
+                return name
+    return TEAM_NAMES.get(team, f"Unknown team: {team}")
 
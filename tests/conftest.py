@@ -0,0 +1,48 @@
+"""
+Shared pytest fixtures for the NFL simulator test suite
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the src directory to Python path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+from nfl_simulator.core.league_structure import create_league_structure, get_league_index
+
+# Standalone repro script, not a test module; run it directly with python
+collect_ignore = ["schedule_manager_test_debug.py"]
+
+
+@pytest.fixture(scope="session")
+def league():
+    """(conferences, divisions, teams) built once for the whole test session"""
+    return create_league_structure()
+
+
+@pytest.fixture(scope="session")
+def teams(league):
+    """All 32 teams from the shared league"""
+    return league[2]
+
+
+@pytest.fixture(scope="session")
+def team_by_abbrev(teams):
+    """Read-only {team_id: Team} index for the shared league"""
+    return get_league_index(teams)[0]
+
+
+@pytest.fixture(scope="session")
+def show():
+    """Print debug lines in a single write when NFL_TEST_VERBOSE is set; a no-op otherwise"""
+    if not os.getenv("NFL_TEST_VERBOSE"):
+        return lambda *lines: None
+
+    def show(*lines):
+        sys.stdout.write("\n".join(map(str, lines)) + "\n")
+    return show
@@ -5,11 +5,12 @@ Focuses on the core functionality without overcomplicating
 """
 
 import sys
-import os
 from pathlib import Path
-import json
 import csv
+import json
+import io
 import tempfile
+from datetime import datetime
 
 # Add the src directory to Python path
 project_root = Path(__file__).parent.parent
@@ -18,17 +19,16 @@ sys.path.insert(0, str(src_path))
 
 from nfl_simulator.models.season import Season
 from nfl_simulator.models.game import Game
-from nfl_simulator.core.league_structure import create_league_structure
+from nfl_simulator.core.league_structure import create_league_structure, get_league_index
+from nfl_simulator.core import schedule_manager
 from nfl_simulator.core.schedule_manager import ScheduleManager, ScheduleLoadError
+from nfl_simulator.utils.constants import canonical_team
 
 
-def test_basic_schedule_loading():
+def test_basic_schedule_loading(teams):
     """Test the most basic schedule loading functionality"""
     print("Testing basic schedule loading...")
-
-    # Create league structure
-    conferences, divisions, teams = create_league_structure()
-    print(f"Created {len(teams)} teams")
+    print(f"Using {len(teams)} teams")
 
     # Create season
     season = Season(
@@ -79,54 +79,101 @@ def test_basic_schedule_loading():
         return False
 
 
-def test_csv_loading():
-    """Test CSV loading"""
-    print("\nTesting CSV loading...")
+CSV_TEXT = (
+    "week,home_team,away_team,date,time\n"
+    "1,KC,BAL,2024-09-05,20:20\n"
+    "1,GB,PHI,2024-09-06,20:15\n"
+)
 
-    # Create league structure
-    conferences, divisions, teams = create_league_structure()
-    season = Season(year=2024, current_week=1, games=[], teams=teams, is_playoffs_started=False)
 
-    # Create CSV data
-    csv_data = [
-        ['week', 'home_team', 'away_team', 'date', 'time'],
-        ['1', 'KC', 'BAL', '2024-09-05', '20:20'],
-        ['1', 'GB', 'PHI', '2024-09-06', '20:15']
+def test_csv_loading(teams):
+    """Test CSV loading from an in-memory text stream, pre-parsed rows and a bytes stream"""
+    print("\nTesting CSV loading...")
+
+    sources = {
+        "text stream": io.StringIO(CSV_TEXT),
+        "rows": list(csv.reader(io.StringIO(CSV_TEXT))),
+        "row tuple": tuple(tuple(row) for row in csv.reader(io.StringIO(CSV_TEXT))),
+        "bytes stream": io.BytesIO(CSV_TEXT.encode('utf-8')),
+    }
+    for kind, source in sources.items():
+        season = Season(year=2024, current_week=1, games=[], teams=teams, is_playoffs_started=False)
+        ScheduleManager(season).load_schedule('manual', source=source)
+
+        print(f"Loaded {len(season.games)} games from CSV {kind}")
+        assert len(season.games) == 2, kind
+        assert [(g.home_team.team_id, g.away_team.team_id) for g in season.games] == [("KC", "BAL"), ("GB", "PHI")], kind
+        assert [g.game_datetime for g in season.games] == [
+            datetime(2024, 9, 5, 20, 20),
+            datetime(2024, 9, 6, 20, 15),
+        ], kind
+
+
+JSON_DOC = json.dumps({
+    "games": [
+        {"week": 1, "home_team": "KC", "away_team": "BAL", "date": "2024-09-05", "time": "20:20"},
+        {"week": 2, "home_team": "PHI", "away_team": "GB"},
     ]
+}).encode('utf-8')
+
 
-    # Write to temp file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        csv_path = f.name
-        writer = csv.writer(f)
-        writer.writerows(csv_data)
+def test_json_loading(teams):
+    """Test JSON loading from bytes and from a file, with orjson (if installed) and the json fallback"""
+    print("\nTesting JSON loading...")
 
+    default_loads = schedule_manager._json_loads
     try:
-        manager = ScheduleManager(season)
-        manager.load_schedule('manual', source=csv_path)
+        for loads in (default_loads, json.loads):
+            schedule_manager._json_loads = loads
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                json_path = Path(tmp_dir) / "schedule.json"
+                json_path.write_bytes(JSON_DOC)
+
+                for source in (JSON_DOC, bytearray(JSON_DOC), json_path):
+                    season = Season(year=2024, current_week=1, games=[], teams=teams, is_playoffs_started=False)
+                    ScheduleManager(season).load_schedule('manual', source=source)
+
+                    print(f"Loaded {len(season.games)} games from {type(source).__name__} with {loads.__module__}")
+                    assert [(g.week, g.home_team.team_id, g.away_team.team_id) for g in season.games] == [
+                        (1, "KC", "BAL"),
+                        (2, "PHI", "GB"),
+                    ]
+                    assert season.games[0].game_datetime == datetime(2024, 9, 5, 20, 20)
+    finally:
+        schedule_manager._json_loads = default_loads
 
-        print(f"Loaded {len(season.games)} games from CSV")
-        if season.games:
-            print(f"First game: {season.games[0]}")
-            return True
-        return False
 
-    except Exception as e:
-        print(f"CSV loading failed: {e}")
-        return False
-    finally:
-        os.unlink(csv_path)
+def test_team_alias_normalization(teams):
+    """Team cells are resolved through aliases, case and surrounding whitespace"""
+    print("\nTesting team alias normalization...")
 
+    assert canonical_team("PATS") == "NE"
+    assert canonical_team(" arizona ") == "ARI"
+    assert canonical_team("kc") == "KC"
+    assert canonical_team("zzz") == "ZZZ"
 
-def test_validation():
+    season = Season(year=2024, current_week=1, games=[], teams=teams, is_playoffs_started=False)
+    manager = ScheduleManager(season)
+    manager.load_schedule('manual', source={"games": [{"week": 1, "home_team": " Pats ", "away_team": "arizona"}]})
+    assert [(g.home_team.team_id, g.away_team.team_id) for g in season.games] == [("NE", "ARI")]
+
+    try:
+        manager._create_game_from_data({"week": 1, "home_team": " zzz ", "away_team": "KC"})
+    except ValueError as e:
+        assert str(e) == "Unknown home team abbreviation: ZZZ"
+    else:
+        raise AssertionError("Unknown team was accepted")
+
+
+def test_validation(teams, team_by_abbrev):
     """Test schedule validation"""
     print("\nTesting validation...")
 
-    conferences, divisions, teams = create_league_structure()
     season = Season(year=2024, current_week=1, games=[], teams=teams, is_playoffs_started=False)
 
     # Add a few games manually
-    kc = next(t for t in teams if t.team_id == "KC")
-    bal = next(t for t in teams if t.team_id == "BAL")
+    kc = team_by_abbrev["KC"]
+    bal = team_by_abbrev["BAL"]
 
     game1 = Game("BAL@KC_W1", kc, bal, 1)
     season.games.append(game1)
@@ -138,21 +185,42 @@ def test_validation():
     return True
 
 
+def test_validation_after_replacing_game(teams, team_by_abbrev):
+    """Validation reflects games replaced in the season after loading"""
+    season = Season(year=2024, current_week=1, games=[], teams=teams, is_playoffs_started=False)
+    manager = ScheduleManager(season)
+    manager.load_schedule('manual', source={"games": [{"week": 1, "home_team": "KC", "away_team": "BAL"}]})
+    assert "Team KC has 1 games, should have 17" in manager.validate_schedule()['issues']
+
+    season.games[0] = Game("NYG@DAL_W1", team_by_abbrev["DAL"], team_by_abbrev["NYG"], 1)
+    issues = manager.validate_schedule()['issues']
+
+    assert "Team DAL has 1 games, should have 17" in issues
+    assert not any("KC" in issue or "BAL" in issue for issue in issues)
+
+
 def main():
     """Run all tests"""
     print("Running Schedule Manager Tests")
     print("=" * 40)
 
+    # Build the league once and share it, as the pytest session fixture does
+    conferences, divisions, teams = create_league_structure()
+    team_by_abbrev = get_league_index(teams)[0]
+
     tests = [
-        test_basic_schedule_loading,
-        test_csv_loading,
-        test_validation
+        (test_basic_schedule_loading, (teams,)),
+        (test_csv_loading, (teams,)),
+        (test_json_loading, (teams,)),
+        (test_team_alias_normalization, (teams,)),
+        (test_validation, (teams, team_by_abbrev)),
+        (test_validation_after_replacing_game, (teams, team_by_abbrev)),
     ]
 
     passed = 0
-    for test in tests:
+    for test, args in tests:
         try:
-            if test():
+            if test(*args) is not False:
                 passed += 1
                 print("PASSED")
             else:
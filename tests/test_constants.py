@@ -0,0 +1,33 @@
+"""
+Test script for utils/constants.py
+"""
+
+import pytest
+
+from nfl_simulator.utils.constants import TEAM_ALIASES, TEAM_CITY_AND_NAME, TEAM_NAMES, get_historical_name
+
+
+@pytest.mark.parametrize("team, year, expected", [
+    ("WAS", 1936, "Washington Commanders"),  # Before the first interval: current name
+    ("WAS", 1937, "Washington Redskins"),
+    ("WAS", 2019, "Washington Redskins"),
+    ("WAS", 2020, "Washington Football Team"),
+    ("WAS", 2021, "Washington Football Team"),
+    ("WAS", 2022, "Washington Commanders"),
+    ("WAS", 2030, "Washington Commanders"),  # Open-ended current interval
+    ("KC", 1970, "Kansas City Chiefs"),  # No historical entries
+    ("XYZ", 2000, "Unknown team: XYZ"),
+])
+def test_get_historical_name(team, year, expected):
+    """Historical names across the WAS interval boundaries and the fallbacks"""
+    assert get_historical_name(team, year) == expected
+    # Memoized repeat lookups return the same answer
+    assert get_historical_name(team, year) == expected
+
+
+def test_team_tables_are_read_only():
+    """Module-level team tables cannot be modified"""
+    for table in (TEAM_NAMES, TEAM_ALIASES, TEAM_CITY_AND_NAME):
+        with pytest.raises(TypeError):
+            table["XYZ"] = "Nowhere"
+    assert TEAM_CITY_AND_NAME["KC"] == ("Kansas City", "Chiefs")
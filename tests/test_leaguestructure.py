@@ -2,90 +2,119 @@
 Test script for core/league_structure.py
 """
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from nfl_simulator.models.team import Team
+from nfl_simulator.utils.constants import TEAM_ORDER, TEAM_IDX, TEAM_NAME_BY_IDX
 from nfl_simulator.core.league_structure import (
-    create_league_structure,
     get_team_by_abbreviation,
     get_division_teams,
     get_conference_teams
 )
 
-print("Testing NFL League Structure Creation...")
-print("=" * 50)
-
-# Test main league creation
-print("Creating complete league structure...")
-conferences, divisions, teams = create_league_structure()
-
-print(f"✅ Created {len(conferences)} conferences")
-print(f"✅ Created {len(divisions)} divisions")
-print(f"✅ Created {len(teams)} teams")
-print()
-
-# Test conferences
-print("Testing Conferences:")
-for conf in conferences:
-    print(f"  - {conf.name}")
-print()
-
-# Test divisions
-print("Testing Divisions:")
-for div in divisions:
-    print(f"  - {div.name} ({div.conference.name})")
-print()
-
-# Test some specific teams
-print("Testing Sample Teams:")
-sample_teams = ["KC", "NE", "DAL", "SF", "BUF"]
-for abbrev in sample_teams:
-    try:
-        team = get_team_by_abbreviation(teams, abbrev)
-        print(f"  - {abbrev}: {team.city} {team.name} - {team.division.name}, {team.conference.name}")
-    except ValueError as e:
-        print(f"  - ❌ {abbrev}: {e}")
-print()
-
-# Test division lookup
-print("Testing Division Lookup:")
-test_divisions = ["AFC East", "NFC West", "AFC North"]
-for div_name in test_divisions:
+
+def test_league_counts(league, show):
+    """Test main league creation"""
+    conferences, divisions, teams = league
+
+    show(f"✅ Created {len(conferences)} conferences",
+         f"✅ Created {len(divisions)} divisions",
+         f"✅ Created {len(teams)} teams")
+
+    assert len(conferences) == 2
+    assert len(divisions) == 8
+    assert len(teams) == 32
+
+
+def test_conferences_and_divisions(league, show):
+    """Test conferences and divisions"""
+    conferences, divisions, teams = league
+
+    show("Testing Conferences:", *(f"  - {conf.name}" for conf in conferences))
+    show("Testing Divisions:", *(f"  - {div.name} ({div.conference.name})" for div in divisions))
+
+    assert [conf.name for conf in conferences] == ["AFC", "NFC"]
+    assert all(div.name.startswith(div.conference.name) for div in divisions)
+
+
+@pytest.mark.parametrize("abbrev", ["KC", "BAL", "NE", "DAL", "SF", "BUF"])
+def test_sample_teams(teams, team_by_abbrev, abbrev, show):
+    """Test some specific teams"""
+    team = get_team_by_abbreviation(teams, abbrev)
+    show(f"  - {abbrev}: {team.city} {team.name} - {team.division.name}, {team.conference.name}")
+    assert team is team_by_abbrev[abbrev]
+    assert team.team_id == abbrev
+    assert TEAM_ORDER[TEAM_IDX[abbrev]] == abbrev
+    assert team.division.conference is team.conference
+
+
+def test_team_ordinals(teams):
+    """TEAM_IDX numbers every league team 0..31 in TEAM_ORDER, with names to match"""
+    assert sorted(TEAM_IDX[team.team_id] for team in teams) == list(range(len(TEAM_ORDER)))
+    assert TEAM_NAME_BY_IDX[TEAM_IDX["KC"]] == "Kansas City Chiefs"
+
+
+def test_unknown_abbreviation(teams):
+    """Unknown abbreviations raise ValueError"""
+    with pytest.raises(ValueError):
+        get_team_by_abbreviation(teams, "XYZ")
+
+
+@pytest.mark.parametrize("div_name", ["AFC East", "NFC West", "AFC North"])
+def test_division_lookup(teams, div_name, show):
+    """Test division lookup"""
     div_teams = get_division_teams(teams, div_name)
-    print(f"  - {div_name}: {len(div_teams)} teams")
-    for team in div_teams:
-        print(f"    • {team.team_id} - {team.name}")
-print()
-
-# Test conference lookup
-print("Testing Conference Lookup:")
-for conf_name in ["AFC", "NFC"]:
+    show(f"  - {div_name}: {len(div_teams)} teams", *(f"    • {team.team_id} - {team.name}" for team in div_teams))
+    assert len(div_teams) == 4
+    assert all(team.division.name == div_name for team in div_teams)
+
+
+@pytest.mark.parametrize("conf_name", ["AFC", "NFC"])
+def test_conference_lookup(teams, conf_name, show):
+    """Test conference lookup"""
     conf_teams = get_conference_teams(teams, conf_name)
-    print(f"  - {conf_name}: {len(conf_teams)} teams")
-print()
-
-# Test team relationships
-print("Testing Team Relationships:")
-chiefs = get_team_by_abbreviation(teams, "KC")
-print(f"Kansas City Chiefs:")
-print(f"  - Team ID: {chiefs.team_id}")
-print(f"  - Full Name: {chiefs.name}")
-print(f"  - City: {chiefs.city}")
-print(f"  - Division: {chiefs.division.name}")
-print(f"  - Conference: {chiefs.conference.name}")
-print()
-
-# Verify total counts
-print("Final Verification:")
-print(f"  - Expected 32 teams, got: {len(teams)}")
-print(f"  - Expected 8 divisions, got: {len(divisions)}")
-print(f"  - Expected 2 conferences, got: {len(conferences)}")
-
-afc_count = len(get_conference_teams(teams, "AFC"))
-nfc_count = len(get_conference_teams(teams, "NFC"))
-print(f"  - AFC teams: {afc_count}, NFC teams: {nfc_count}")
-
-# Check that each division has 4 teams
-print("  - Teams per division:")
-for div in divisions:
-    div_teams = get_division_teams(teams, div.name)
-    print(f"    {div.name}: {len(div_teams)} teams")
-
-print("\n✅ League structure test completed!")
\ No newline at end of file
+    show(f"  - {conf_name}: {len(conf_teams)} teams")
+    assert len(conf_teams) == 16
+
+
+def test_team_relationships(team_by_abbrev, show):
+    """Test team relationships"""
+    chiefs = team_by_abbrev["KC"]
+    show("Kansas City Chiefs:",
+         f"  - Team ID: {chiefs.team_id}",
+         f"  - Full Name: {chiefs.name}",
+         f"  - City: {chiefs.city}",
+         f"  - Division: {chiefs.division.name}",
+         f"  - Conference: {chiefs.conference.name}")
+
+    assert chiefs.city == "Kansas City"
+    assert chiefs.name == "Chiefs"
+    assert chiefs.division.name == "AFC West"
+    assert chiefs.conference.name == "AFC"
+
+    # League objects are shared between tests and seasons, so they are read-only
+    with pytest.raises(FrozenInstanceError):
+        chiefs.name = "Royals"
+
+
+def test_teams_per_division(league, show):
+    """Check that each division has 4 teams"""
+    conferences, divisions, teams = league
+
+    counts = {div.name: len(get_division_teams(teams, div.name)) for div in divisions}
+    show("  - Teams per division:", *(f"    {name}: {count} teams" for name, count in counts.items()))
+    assert all(count == 4 for count in counts.values())
+
+
+def test_lookups_follow_in_place_edits(teams):
+    """Lookups reflect a team replaced in place in a list of the same length"""
+    edited = list(teams)
+    kc_pos = next(i for i, team in enumerate(edited) if team.team_id == "KC")
+    old_chiefs = get_team_by_abbreviation(edited, "KC")
+
+    edited[kc_pos] = Team("KC", "Chiefs2", "Kansas City", old_chiefs.division)
+
+    assert get_team_by_abbreviation(edited, "KC").name == "Chiefs2"
+    assert get_team_by_abbreviation(teams, "KC") is old_chiefs
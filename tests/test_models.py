@@ -0,0 +1,25 @@
+"""
+Test script for the models package
+"""
+
+from nfl_simulator.models.game import Game
+from nfl_simulator.models.season import Season
+
+
+def test_game_table_arrays_and_identity(team_by_abbrev, teams):
+    """Season.as_arrays reflects current results; tables compare and hash by identity"""
+    game = Game("BAL@KC_W1", team_by_abbrev["KC"], team_by_abbrev["BAL"], 1)
+    season = Season(2024, 1, [game], teams, False, None)
+
+    table = season.as_arrays()
+    assert len(table) == 1
+    assert not table.played[0]
+
+    game.set_result(24, 17)
+    played = season.as_arrays()
+    assert teams[played.home_idx[0]] is team_by_abbrev["KC"]
+    assert (played.home_scores[0], played.away_scores[0], played.played[0]) == (24, 17, True)
+
+    assert table == table
+    assert table != played
+    assert hash(table) == hash(table)
@@ -2,84 +2,95 @@
 Test script for predictions.py models
 """
 
+from types import SimpleNamespace
+
+import pytest
+
 from nfl_simulator.models.team import Team, Division, Conference
 from nfl_simulator.models.game import Game
 from nfl_simulator.models.season import Season
 from nfl_simulator.models.player import Player
 from nfl_simulator.models.predictions import GamePrediction, PlayerStatPrediction, SeasonPrediction
 
-# Create test data
-print("Setting up test data...")
-
-# Create conferences and divisions
-afc = Conference("AFC")
-nfc = Conference("NFC")
-afc_west = Division("AFCW", "AFC West", afc)
-nfc_east = Division("NFCE", "NFC East", nfc)
-
-# Create teams
-chiefs = Team("KC", "Kansas City Chiefs", "Kansas City", afc_west)
-raiders = Team("LV", "Las Vegas Raiders", "Las Vegas", afc_west)
-eagles = Team("PHI", "Philadelphia Eagles", "Philadelphia", nfc_east)
-cowboys = Team("DAL", "Dallas Cowboys", "Dallas", nfc_east)
-
-# Create players
-mahomes = Player(1, "Patrick Mahomes", "QB", chiefs)
-adams = Player(2, "Davante Adams", "WR", raiders)
-
-# Create a game
-test_game = Game("KC_LV_W1", chiefs, raiders, 1)
-
-# Create a season (minimal for testing)
-all_teams = [chiefs, raiders, eagles, cowboys]
-all_games = [test_game]
-test_season = Season(2024, 1, all_games, all_teams, False, None)
-
-print("Test data created successfully!\n")
-
-# Test GamePrediction
-print("Testing GamePrediction...")
-game_pred = GamePrediction(test_game, chiefs, (28, 21), 0.75)
-print(f"Game prediction created: {game_pred}")
-print(f"Repr: {repr(game_pred)}")
-print(f"Predicted winner: {game_pred.predicted_winner.name}")
-print(f"Confidence: {game_pred.confidence}")
-print()
-
-# Test PlayerStatPrediction
-print("Testing PlayerStatPrediction...")
-mahomes_stats = {
+MAHOMES_STATS = {
     "passing_yards": 325,
     "passing_tds": 3,
     "interceptions": 1,
     "completions": 24,
     "attempts": 35
 }
-player_pred = PlayerStatPrediction(mahomes, test_game, mahomes_stats)
-print(f"Player prediction created: {player_pred}")
-print(f"Repr: {repr(player_pred)}")
-print(f"Predicted passing yards: {player_pred.predicted_stats['passing_yards']}")
-print()
-
-# Test SeasonPrediction
-print("Testing SeasonPrediction...")
-playoff_teams = [chiefs, eagles, cowboys]  # Just 3 for testing
-season_pred = SeasonPrediction(test_season, playoff_teams, chiefs)
-print(f"Season prediction created: {season_pred}")
-print(f"Repr: {repr(season_pred)}")
-print(f"Number of playoff teams: {len(season_pred.playoff_teams)}")
-print(f"Super Bowl winner: {season_pred.super_bowl_winner.name}")
-print()
-
-# Test equality methods
-print("Testing equality methods...")
-game_pred2 = GamePrediction(test_game, raiders, (21, 28), 0.60)
-print(f"Same game predictions equal? {game_pred == game_pred2}")
-
-player_pred2 = PlayerStatPrediction(mahomes, test_game, {"passing_yards": 280})
-print(f"Same player/game predictions equal? {player_pred == player_pred2}")
-
-season_pred2 = SeasonPrediction(test_season, [eagles], eagles)
-print(f"Same season predictions equal? {season_pred == season_pred2}")
-
-print("\nAll prediction tests completed successfully!")
\ No newline at end of file
+
+
+@pytest.fixture(scope="module")
+def data():
+    """Minimal teams, players, game and season shared by the prediction tests"""
+    # Create conferences and divisions
+    afc = Conference("AFC")
+    nfc = Conference("NFC")
+    afc_west = Division("AFCW", "AFC West", afc)
+    nfc_east = Division("NFCE", "NFC East", nfc)
+
+    # Create teams
+    chiefs = Team("KC", "Kansas City Chiefs", "Kansas City", afc_west)
+    raiders = Team("LV", "Las Vegas Raiders", "Las Vegas", afc_west)
+    eagles = Team("PHI", "Philadelphia Eagles", "Philadelphia", nfc_east)
+    cowboys = Team("DAL", "Dallas Cowboys", "Dallas", nfc_east)
+
+    # Create players
+    mahomes = Player(1, "Patrick Mahomes", "QB", chiefs)
+    adams = Player(2, "Davante Adams", "WR", raiders)
+
+    # Create a game
+    test_game = Game("KC_LV_W1", chiefs, raiders, 1)
+
+    # Create a season (minimal for testing)
+    test_season = Season(2024, 1, [test_game], [chiefs, raiders, eagles, cowboys], False, None)
+
+    return SimpleNamespace(chiefs=chiefs, raiders=raiders, eagles=eagles, cowboys=cowboys,
+                           mahomes=mahomes, adams=adams, game=test_game, season=test_season)
+
+
+def test_game_prediction(data, show):
+    """Test GamePrediction"""
+    game_pred = GamePrediction(data.game, data.chiefs, (28, 21), 0.75)
+    show(f"Game prediction created: {game_pred}", f"Repr: {game_pred!r}")
+
+    assert game_pred.predicted_winner is data.chiefs
+    assert game_pred.confidence == 0.75
+    assert str(game_pred) == "Prediction: Kansas City Chiefs beats Las Vegas Raiders (28-21)"
+
+
+def test_player_stat_prediction(data, show):
+    """Test PlayerStatPrediction"""
+    player_pred = PlayerStatPrediction(data.mahomes, data.game, MAHOMES_STATS)
+    show(f"Player prediction created: {player_pred}", f"Repr: {player_pred!r}")
+
+    assert player_pred.predicted_stats["passing_yards"] == 325
+    assert "stats=5 categories" in repr(player_pred)
+
+
+def test_season_prediction(data, show):
+    """Test SeasonPrediction"""
+    playoff_teams = [data.chiefs, data.eagles, data.cowboys]  # Just 3 for testing
+    season_pred = SeasonPrediction(data.season, playoff_teams, data.chiefs)
+    show(f"Season prediction created: {season_pred}", f"Repr: {season_pred!r}")
+
+    assert len(season_pred.playoff_teams) == 3
+    assert season_pred.super_bowl_winner is data.chiefs
+
+
+def test_prediction_equality(data):
+    """Predictions for the same game/player/season compare equal"""
+    game_pred = GamePrediction(data.game, data.chiefs, (28, 21), 0.75)
+    game_pred2 = GamePrediction(data.game, data.raiders, (21, 28), 0.60)
+    assert game_pred == game_pred2
+    assert hash(game_pred) == hash(game_pred2)
+
+    player_pred = PlayerStatPrediction(data.mahomes, data.game, MAHOMES_STATS)
+    player_pred2 = PlayerStatPrediction(data.mahomes, data.game, {"passing_yards": 280})
+    assert player_pred == player_pred2
+    assert player_pred != PlayerStatPrediction(data.adams, data.game, {})
+
+    season_pred = SeasonPrediction(data.season, [data.chiefs], data.chiefs)
+    season_pred2 = SeasonPrediction(data.season, [data.eagles], data.eagles)
+    assert season_pred == season_pred2
@@ -2,7 +2,8 @@
 Test script for core/standings.py
 """
 
-from nfl_simulator.core.league_structure import create_league_structure, get_team_by_abbreviation
+import pytest
+
 from nfl_simulator.models.game import Game
 from nfl_simulator.models.season import Season
 from nfl_simulator.core.standings import (
@@ -13,126 +14,148 @@ from nfl_simulator.core.standings import (
     TeamRecord
 )
 
-print("Testing NFL Standings Calculator...")
-print("=" * 50)
+# (game_id, home, away, week, (home_score, away_score))
+GAMES_DATA = [
+    # AFC East matchups
+    ("BUF_NE_W1", "BUF", "NE", 1, (24, 17)),  # Bills beat Patriots
+    ("MIA_NYJ_W1", "MIA", "NYJ", 1, (21, 14)),  # Dolphins beat Jets
+    ("BUF_MIA_W2", "BUF", "MIA", 2, (31, 28)),  # Bills beat Dolphins
+    ("NE_NYJ_W2", "NE", "NYJ", 2, (20, 13)),  # Patriots beat Jets
 
-# Create league structure
-print("Setting up league and sample games...")
-conferences, divisions, teams = create_league_structure()
+    # AFC West matchups
+    ("KC_LV_W1", "KC", "LV", 1, (28, 21)),  # Chiefs beat Raiders
+    ("DEN_LAC_W1", "DEN", "LAC", 1, (24, 17)),  # Broncos beat Chargers
+    ("KC_DEN_W2", "KC", "DEN", 2, (35, 14)),  # Chiefs beat Broncos
+    ("LV_LAC_W2", "LV", "LAC", 2, (27, 20)),  # Raiders beat Chargers
 
-# Create some sample games with results
-sample_games = []
+    # NFC East matchups
+    ("PHI_DAL_W1", "PHI", "DAL", 1, (26, 17)),  # Eagles beat Cowboys
+    ("NYG_WAS_W1", "NYG", "WAS", 1, (21, 18)),  # Giants beat Commanders
+    ("PHI_NYG_W2", "PHI", "NYG", 2, (28, 14)),  # Eagles beat Giants
+    ("DAL_WAS_W2", "DAL", "WAS", 2, (24, 21)),  # Cowboys beat Commanders
 
-# AFC East games (Week 1)
-bills = get_team_by_abbreviation(teams, "BUF")
-patriots = get_team_by_abbreviation(teams, "NE")
-dolphins = get_team_by_abbreviation(teams, "MIA")
-jets = get_team_by_abbreviation(teams, "NYJ")
+    # Add a tie game for testing
+    ("BUF_KC_W3", "BUF", "KC", 3, (21, 21)),  # Bills tie Chiefs
+]
 
-# AFC West games
-chiefs = get_team_by_abbreviation(teams, "KC")
-raiders = get_team_by_abbreviation(teams, "LV")
-broncos = get_team_by_abbreviation(teams, "DEN")
-chargers = get_team_by_abbreviation(teams, "LAC")
+ACTIVE_TEAMS = ["BUF", "NE", "MIA", "NYJ", "KC", "LV", "DEN", "LAC", "PHI", "DAL", "NYG", "WAS"]
 
-# NFC East games
-eagles = get_team_by_abbreviation(teams, "PHI")
-cowboys = get_team_by_abbreviation(teams, "DAL")
-giants = get_team_by_abbreviation(teams, "NYG")
-commanders = get_team_by_abbreviation(teams, "WAS")
 
-# Create and play some games
-games_data = [
-    # AFC East matchups
-    ("BUF_NE_W1", bills, patriots, 1, (24, 17)),  # Bills beat Patriots
-    ("MIA_NYJ_W1", dolphins, jets, 1, (21, 14)),  # Dolphins beat Jets
-    ("BUF_MIA_W2", bills, dolphins, 2, (31, 28)),  # Bills beat Dolphins
-    ("NE_NYJ_W2", patriots, jets, 2, (20, 13)),  # Patriots beat Jets
+@pytest.fixture(scope="module")
+def sample_games(team_by_abbrev):
+    """Create Game objects and set results"""
+    games = []
+    for game_id, home, away, week, score in GAMES_DATA:
+        game = Game(game_id, team_by_abbrev[home], team_by_abbrev[away], week)
+        game.set_result(score[0], score[1])
+        games.append(game)
+    return games
 
-    # AFC West matchups
-    ("KC_LV_W1", chiefs, raiders, 1, (28, 21)),  # Chiefs beat Raiders
-    ("DEN_LAC_W1", broncos, chargers, 1, (24, 17)),  # Broncos beat Chargers
-    ("KC_DEN_W2", chiefs, broncos, 2, (35, 14)),  # Chiefs beat Broncos
-    ("LV_LAC_W2", raiders, chargers, 2, (27, 20)),  # Raiders beat Chargers
 
-    # NFC East matchups
-    ("PHI_DAL_W1", eagles, cowboys, 1, (26, 17)),  # Eagles beat Cowboys
-    ("NYG_WAS_W1", giants, commanders, 1, (21, 18)),  # Giants beat Commanders
-    ("PHI_NYG_W2", eagles, giants, 2, (28, 14)),  # Eagles beat Giants
-    ("DAL_WAS_W2", cowboys, commanders, 2, (24, 21)),  # Cowboys beat Commanders
+@pytest.fixture(scope="module")
+def team_records(sample_games, teams):
+    return calculate_team_records(sample_games, teams)
 
-    # Add a tie game for testing
-    ("BUF_KC_W3", bills, chiefs, 3, (21, 21)),  # Bills tie Chiefs
-]
 
-# Create Game objects and set results
-for game_id, home, away, week, score in games_data:
-    game = Game(game_id, home, away, week)
-    game.set_result(score[0], score[1])
-    sample_games.append(game)
+def test_team_records(team_records, show):
+    """Test calculate_team_records()"""
+    show("Team Records:", *(f"  {team_records[abbrev]}" for abbrev in ACTIVE_TEAMS))
 
-print(f"✅ Created {len(sample_games)} sample games with results")
+    assert len(team_records) == 32
+    assert all(team_records[abbrev].games_played == 2 for abbrev in ACTIVE_TEAMS if abbrev not in ("BUF", "KC"))
+    assert (team_records["PHI"].wins, team_records["PHI"].losses) == (2, 0)
+    assert (team_records["NYJ"].wins, team_records["NYJ"].losses) == (0, 2)
 
-# Create a test season
-test_season = Season(2024, 3, sample_games, teams, False, None)
-print("✅ Created test season")
-print()
 
-# Test individual functions
-print("Testing calculate_team_records()...")
-team_records = calculate_team_records(sample_games, teams)
+def test_tie_game(team_records, show):
+    """Tie game counts as half a win for both teams"""
+    show(f"Tie game test - Bills record: {team_records['BUF']}",
+         f"Tie game test - Chiefs record: {team_records['KC']}")
 
-# Show records for teams that played games
-active_teams = ["BUF", "NE", "MIA", "NYJ", "KC", "LV", "DEN", "LAC", "PHI", "DAL", "NYG", "WAS"]
-print("Team Records:")
-for abbrev in active_teams:
-    if abbrev in team_records:
+    for abbrev in ("BUF", "KC"):
         record = team_records[abbrev]
-        print(f"  {record}")
+        assert (record.wins, record.losses, record.ties) == (2, 0, 1)
+        assert record.win_percentage == pytest.approx(2.5 / 3)
 
-print(f"\nTie game test - Bills record: {team_records['BUF']}")
-print(f"Tie game test - Chiefs record: {team_records['KC']}")
-print()
 
-# Test division standings
-print("Testing calculate_division_standings()...")
-division_standings = calculate_division_standings(teams, team_records)
+def test_division_standings(teams, team_records, show):
+    """Test calculate_division_standings()"""
+    division_standings = calculate_division_standings(teams, team_records)
 
-for div_standing in division_standings:
     # Only show divisions with games played
-    if any(team.games_played > 0 for team in div_standing.teams):
-        print(div_standing)
-
-# Test conference standings
-print("Testing calculate_conference_standings()...")
-conference_standings = calculate_conference_standings(teams, team_records)
-
-for conf_standing in conference_standings:
-    # Only show if conference has games played
-    has_games = any(
-        any(team.games_played > 0 for team in div.teams)
-        for div in conf_standing.division_standings
-    )
-    if has_games:
-        print(conf_standing)
-
-# Test main standings function
-print("\nTesting main calculate_standings() function...")
-all_records, all_conference_standings = calculate_standings(test_season)
-
-print(f"✅ Processed {len([r for r in all_records.values() if r.games_played > 0])} teams with games")
-print(f"✅ Generated standings for {len(all_conference_standings)} conferences")
-
-# Test some specific scenarios
-print("\nSpecific Tests:")
-print(f"Bills win percentage (with tie): {team_records['BUF'].win_percentage:.3f}")
-print(f"Chiefs win percentage (with tie): {team_records['KC'].win_percentage:.3f}")
-
-# Verify AFC East standings order
-afc_east_teams = [team_records[abbrev] for abbrev in ["BUF", "NE", "MIA", "NYJ"]]
-afc_east_teams.sort(key=lambda x: x.win_percentage, reverse=True)
-print("\nAFC East order by win percentage:")
-for i, team in enumerate(afc_east_teams, 1):
-    print(f"  {i}. {team}")
-
-print("\n✅ All standings tests completed successfully!")
\ No newline at end of file
+    show(*(div_standing for div_standing in division_standings
+           if any(team.games_played > 0 for team in div_standing.teams)))
+
+    assert len(division_standings) == 8
+    afc_east = next(d for d in division_standings if d.division_name == "AFC East")
+    assert afc_east.teams[0].team.team_id == "BUF"
+    assert afc_east.teams[-1].team.team_id == "NYJ"
+
+
+def test_conference_standings(teams, team_records, show):
+    """Test calculate_conference_standings()"""
+    conference_standings = calculate_conference_standings(teams, team_records)
+
+    # Only show conferences with games played
+    show(*(conf_standing for conf_standing in conference_standings
+           if any(team.games_played > 0 for div in conf_standing.division_standings for team in div.teams)))
+
+    assert [c.conference_name for c in conference_standings] == ["AFC", "NFC"]
+    for conf_standing in conference_standings:
+        assert len(conf_standing.division_standings) == 4
+        assert len(conf_standing.wild_card_teams) == 3
+        assert len(conf_standing.playoff_teams) == 7
+
+
+def test_calculate_standings(sample_games, teams, show):
+    """Test main calculate_standings() function"""
+    test_season = Season(2024, 3, sample_games, teams, False, None)
+    all_records, all_conference_standings = calculate_standings(test_season)
+
+    teams_with_games = [r for r in all_records.values() if r.games_played > 0]
+    show(f"✅ Processed {len(teams_with_games)} teams with games",
+         f"✅ Generated standings for {len(all_conference_standings)} conferences")
+
+    assert len(teams_with_games) == len(ACTIVE_TEAMS)
+    assert len(all_conference_standings) == 2
+
+
+def test_afc_east_order(team_records, show):
+    """Verify AFC East standings order"""
+    afc_east_teams = [team_records[abbrev] for abbrev in ["BUF", "NE", "MIA", "NYJ"]]
+    afc_east_teams.sort(key=lambda x: x.win_percentage, reverse=True)
+    show("AFC East order by win percentage:", *(f"  {i}. {team}" for i, team in enumerate(afc_east_teams, 1)))
+
+    assert isinstance(afc_east_teams[0], TeamRecord)
+    assert [r.team.team_id for r in afc_east_teams] == ["BUF", "NE", "MIA", "NYJ"]
+
+
+def test_standings_pick_up_new_results(team_by_abbrev, teams):
+    """Results set after a standings pass are included in the next one"""
+    game = Game("NE_BUF_W4", team_by_abbrev["NE"], team_by_abbrev["BUF"], 4)
+    season = Season(2024, 4, [game], teams, False, None)
+
+    records, _ = calculate_standings(season)
+    assert records["NE"].games_played == 0
+
+    game.set_result(17, 10)
+    records, _ = calculate_standings(season)
+    assert (records["NE"].wins, records["BUF"].losses) == (1, 1)
+
+
+def test_standings_pick_up_replaced_games(team_by_abbrev, teams):
+    """A game replaced in place is counted instead of the one it replaced"""
+    game = Game("BAL_KC_W1", team_by_abbrev["KC"], team_by_abbrev["BAL"], 1)
+    game.set_result(10, 3)
+    season = Season(2024, 1, [game], teams, False, None)
+
+    records, _ = calculate_standings(season)
+    assert records["KC"].wins == 1
+
+    replacement = Game("NYG_DAL_W1", team_by_abbrev["DAL"], team_by_abbrev["NYG"], 1)
+    replacement.set_result(10, 3)
+    season.games[0] = replacement
+
+    records, _ = calculate_standings(season)
+    assert (records["KC"].wins, records["DAL"].wins) == (0, 1)
+    assert records == calculate_team_records(season.games, teams)